@@ -1,12 +1,16 @@
-import os
-import json
+import asyncio
+import hashlib
 import logging
-from typing import List, Dict, Any
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from asyncio import run
+import orjson
+from pathlib import Path
+from typing import Dict, Any
 from dotenv import load_dotenv
 
+from src.config.llm_config import get_llm_config
 from src.core.mc_scraper_service import MCScraperService
+from src.core.scraping_service import ScrapingService
+from src.transformers.crawl_transformers import CrawlTransformers
+from src.transformers.crawl_transformers_main_content import CrawlTransformersMainContent
 
 # Load environment variables from .env file
 load_dotenv()
@@ -27,48 +31,87 @@ urls = [
     "https://developers.google.com/search/docs/fundamentals/seo-starter-guide",
 ]
 
+# Maximum number of URLs scraped at the same time
+MAX_CONCURRENCY = 10
 
-def process_results(results: List[Dict[str, Any]]) -> None:
-    """Processes and saves the results to files."""
-    output_dir = "output"
-    os.makedirs(output_dir, exist_ok=True)
-    for result in results:
-        filename_base = result['url'].replace('/', '_').replace(':', '_')
+# Maximum number of pages rendered in parallel on the shared browser
+MAX_BROWSER_CONTEXTS = 5
 
-        if "error" not in result:
-            # Save main content as markdown
-            with open(os.path.join(output_dir, f"{filename_base}.md"), "w", encoding="utf-8") as f:
-                f.write(result.get("main_content_markdown", ""))
+# Directory where scraped results are written
+OUTPUT_DIR = Path("output")
 
-            # Save extracted links as JSON
-            with open(os.path.join(output_dir, f"{filename_base}_links.json"), "w", encoding="utf-8") as f:
-                json.dump(result.get("links", []), f, indent=4)
-        else:
-            logger.error(f"Failed to process {result['url']}: {result['error']}")
 
-async def scrape_url(url: str) -> Dict[str, Any]:
+def output_basename(url: str) -> str:
+    """Builds a collision-free file name stem for a URL: a readable prefix plus a hash of the full URL."""
+    readable = url.replace('/', '_').replace(':', '_')[:100]
+    digest = hashlib.blake2b(url.encode("utf-8"), digest_size=8).hexdigest()
+    return f"{readable}_{digest}"
+
+
+def save_result(result: Dict[str, Any]) -> None:
+    """Saves a single result to files."""
+    if "error" not in result:
+        filename_base = output_basename(result['url'])
+
+        # Save main content as markdown
+        (OUTPUT_DIR / f"{filename_base}.md").write_text(result.get("main_content_markdown", ""), encoding="utf-8")
+
+        # Save extracted links as JSON
+        (OUTPUT_DIR / f"{filename_base}_links.json").write_bytes(
+            orjson.dumps(result.get("links", []), option=orjson.OPT_INDENT_2)
+        )
+    else:
+        logger.error(f"Failed to process {result['url']}: {result['error']}")
+
+
+async def scrape_url(
+    url: str,
+    scraping_service: ScrapingService,
+    crawl_transformers: CrawlTransformers,
+    main_content_extractor: CrawlTransformersMainContent,
+) -> Dict[str, Any]:
     """Asynchronously scrapes a URL using MCScraperService."""
-    scraper = MCScraperService(link=url)
+    scraper = MCScraperService(
+        link=url,
+        scraping_service=scraping_service,
+        crawl_transformers=crawl_transformers,
+        main_content_extractor=main_content_extractor,
+    )
     return await scraper.invoke()
 
 
-def main():
-    """Main function to orchestrate crawling and extraction."""
-    results = []
+async def main_async() -> None:
+    """Main coroutine to orchestrate crawling and extraction on a single event loop."""
+    sem = asyncio.Semaphore(MAX_CONCURRENCY)
+    # Build the services once and share them across all URLs
+    scraping_service = ScrapingService(max_browser_contexts=MAX_BROWSER_CONTEXTS)
+    crawl_transformers = CrawlTransformers()
+    main_content_extractor = CrawlTransformersMainContent(get_llm_config())
+
+    async def bounded(url: str) -> Dict[str, Any]:
+        async with sem:
+            result = await scrape_url(url, scraping_service, crawl_transformers, main_content_extractor)
+        # Write each result as soon as it is ready, off the event loop
+        await asyncio.to_thread(save_result, result)
+        return result
+
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
-    with ThreadPoolExecutor(max_workers=10) as executor:
-        # Submit tasks for each URL
-        futures = [executor.submit(run, scrape_url(url)) for url in urls]
+    # The shared browser is launched on the first URL that needs JS rendering
+    try:
+        # Run all URLs concurrently, bounded by the semaphore
+        outcomes = await asyncio.gather(*(bounded(url) for url in urls), return_exceptions=True)
+    finally:
+        await scraping_service.close()
 
-        # Collect results as they complete
-        for future in as_completed(futures):
-            try:
-                result = future.result()
-                results.append(result)
-            except Exception as exc:
-                logger.error(f"A task generated an exception: {exc}")
+    for outcome in outcomes:
+        if isinstance(outcome, BaseException):
+            logger.error(f"A task generated an exception: {outcome}")
 
-    process_results(results)
+
+def main():
+    """Main function to orchestrate crawling and extraction."""
+    asyncio.run(main_async())
 
 
 if __name__ == "__main__":
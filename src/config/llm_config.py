@@ -5,10 +5,11 @@ def get_llm_config() -> Dict[str, Any]:
     """Retrieves and validates LLM configuration parameters from environment variables."""
 
     llm_config: Dict[str, Any] = {
-        "model": os.getenv("LLM_MODEL", "gpt-4o"),  # Default to gpt-4o if not set
+        "model": os.getenv("LLM_MODEL", "gpt-4o-mini"),  # Default to gpt-4o-mini if not set; selector extraction is a short, simple output
         "provider": os.getenv("LLM_PROVIDER", "openai"),  # Default to OpenAI
         "api_key": os.getenv("OPENAI_API_KEY", ""),  # No default for API key; must be set
         "temperature": float(os.getenv("LLM_TEMPERATURE", "0.0")),  # Default temperature 0.0
+        "cache_dir": os.getenv("LLM_CACHE_DIR", ".mc_cache"),  # Selector cache location; empty disables disk cache
     }
 
     if not llm_config["api_key"]:
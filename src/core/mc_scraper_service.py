@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from typing import Dict, Any, Optional
 from venv import logger
@@ -8,18 +9,50 @@ from src.config.llm_config import get_llm_config
 
 logger = logging.getLogger(__name__)    
 
+# Lazily built defaults shared by every MCScraperService that is not given its own
+_default_crawl_transformers: Optional[CrawlTransformers] = None
+_default_main_content_extractor: Optional[CrawlTransformersMainContent] = None
+
+
+def _get_default_crawl_transformers() -> CrawlTransformers:
+    """Return the shared CrawlTransformers, creating it on first use."""
+    global _default_crawl_transformers
+    if _default_crawl_transformers is None:
+        _default_crawl_transformers = CrawlTransformers()
+    return _default_crawl_transformers
+
+
+def _get_default_main_content_extractor() -> CrawlTransformersMainContent:
+    """Return the shared main content extractor, loading the LLM config and client on first use."""
+    global _default_main_content_extractor
+    if _default_main_content_extractor is None:
+        _default_main_content_extractor = CrawlTransformersMainContent(get_llm_config())
+    return _default_main_content_extractor
+
+
 class MCScraperService:
-    def __init__(self, link: str):
+    def __init__(
+        self,
+        link: str,
+        scraping_service: Optional[ScrapingService] = None,
+        crawl_transformers: Optional[CrawlTransformers] = None,
+        main_content_extractor: Optional[CrawlTransformersMainContent] = None,
+    ):
         """
         Initialize the MC (Main Content) Scraper Node.
 
         :param link (str): The URL to scrape.
+        :param scraping_service (Optional[ScrapingService]): Shared scraping service. If omitted, a new one is created and closed when `invoke` finishes.
+        :param crawl_transformers (Optional[CrawlTransformers]): Shared transformer pipeline. Defaults to a module-level instance.
+        :param main_content_extractor (Optional[CrawlTransformersMainContent]): Shared extractor. Defaults to a module-level instance.
         """
         self.link = link
-        self.llm_config = get_llm_config()
-        self.scraping_service = ScrapingService()
-        self.crawl_transformers = CrawlTransformers()
-        self.main_content_extractor = CrawlTransformersMainContent(self.llm_config)
+        # Only a service created here is closed by invoke(); an injected one belongs to the caller
+        self._owns_scraping_service = scraping_service is None
+        self.scraping_service = scraping_service or ScrapingService()
+        self.crawl_transformers = crawl_transformers or _get_default_crawl_transformers()
+        self.main_content_extractor = main_content_extractor or _get_default_main_content_extractor()
+        self.llm_config = self.main_content_extractor.llm_config
 
     async def fetch_main_content(self, url: str) -> Optional[Dict[str, Any]]:
         """
@@ -30,8 +63,8 @@ class MCScraperService:
         :returns Optional[Dict[str, Any]]: The main content data or None if fetching fails.
         """
         try:
-            # Fetch the HTML content
-            fetched_data = await self.scraping_service.fetch_url(url, render_js=True)
+            # Fetch the HTML content, only rendering JS when the static fetch is not usable
+            fetched_data = await self.scraping_service.fetch_url_adaptive(url)
 
             # Check if fetch was successful
             if not fetched_data.html or fetched_data.status_code != 200:
@@ -40,10 +73,10 @@ class MCScraperService:
             # Prepare metadata and document for transformers
             meta = self._prepare_meta(url)
             document = {"rawHtml": fetched_data.html, "metadata": {}}
-            cleaned_document = self.crawl_transformers.execute_transformers(meta, document)
-            
-            # Use the Main Content Extractor to extract main content
-            main_content = self.main_content_extractor.extract_main_content(url, cleaned_document)
+
+            # Parsing, cleaning, Markdown conversion and the LLM call are all blocking,
+            # so run them off the event loop to keep other URLs' network I/O progressing.
+            main_content = await asyncio.to_thread(self._transform_and_extract, url, meta, document)
             return {
                 "url": url,
                 "main_content_html": main_content["mc_html"],
@@ -54,6 +87,19 @@ class MCScraperService:
             return {"url": url, "error": f"Error fetching main content: {e}"}
 
 
+    def _transform_and_extract(self, url: str, meta: Dict, document: Dict) -> Dict[str, Any]:
+        """
+        Run the transformer pipeline and main content extraction on a fetched document.
+
+        :param url (str): The URL the document was fetched from.
+        :param meta (Dict): Metadata for the transformers.
+        :param document (Dict): Document holding the fetched rawHtml.
+
+        :returns Dict[str, Any]: The cleaned document with main content details added.
+        """
+        cleaned_document = self.crawl_transformers.execute_transformers(meta, document)
+        return self.main_content_extractor.extract_main_content(url, cleaned_document)
+
     def _prepare_meta(self, url: str) -> Dict:
         """Helper to prepare meta information."""
         return {
@@ -76,3 +122,6 @@ class MCScraperService:
             return result
         except Exception as e:
             return {"url": self.link, "error": f"Exception occurred: {str(e)}"}
+        finally:
+            if self._owns_scraping_service:
+                await self.scraping_service.close()
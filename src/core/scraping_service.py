@@ -1,65 +1,147 @@
 import os
+import re
+import asyncio
 import logging
 from typing import Any, Dict, Optional
 import aiohttp
-from playwright.async_api import async_playwright
 from src.transformers.crawl_transformers import CrawlTransformers
 from src.models.scraping_service_models import ScrapingServiceOutput
 
 
 logger = logging.getLogger(__name__)
 
+# Static HTML shorter than this is assumed to be a JS app shell and is re-fetched with Playwright
+MIN_STATIC_HTML_LENGTH = 2048
+
+# Static HTML whose <body> shows fewer visible characters than this is treated as a JS app shell as well
+MIN_STATIC_BODY_TEXT_LENGTH = 200
+
+# Subresources that never reach the HTML we consume; Playwright aborts these requests
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media", "stylesheet"})
+
+# Navigation timeout for Playwright page loads, in milliseconds
+NAVIGATION_TIMEOUT_MS = 15000
+
+# External scripts suggest the DOM is built client-side, so the raw response cannot be trusted as-is
+_EXTERNAL_SCRIPT = re.compile(r"<script[^>]+\bsrc\s*=", re.IGNORECASE)
+
+_BODY_OPEN = re.compile(r"<body\b", re.IGNORECASE)
+# Tokens of the body markup: invisible elements, comments and tags are skipped; group 2 is a run of text
+_BODY_TOKEN = re.compile(
+    r"<(script|style|noscript|template)\b.*?</\1\s*>|<!--.*?-->|<[^>]*>|([^<]+)", re.IGNORECASE | re.DOTALL
+)
+
 
 class ScrapingService:
-    def __init__(self):
-        """Initializes the ScrapingService."""
+    def __init__(self, max_browser_contexts: int = 5):
+        """
+        Initializes the ScrapingService.
+
+        :param max_browser_contexts: Maximum number of Playwright contexts open at once on the shared browser.
+        """
         self.crawl_transformers = CrawlTransformers()
         self.user_agent = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/98.0.4758.102 Safari/537.36'
+        self._pw = None
+        self._browser = None
+        self._sess: Optional[aiohttp.ClientSession] = None
+        self._start_lock = asyncio.Lock()
+        self._context_slots = asyncio.Semaphore(max_browser_contexts)
+
+    async def start(self) -> None:
+        """Start a long-lived Playwright driver and browser shared by all requests."""
+        async with self._start_lock:
+            if self._browser is not None:
+                return
+            # Imported here so processes that never render JS skip the Playwright import
+            from playwright.async_api import async_playwright
+
+            self._pw = await async_playwright().start()
+            self._browser = await self._pw.chromium.launch()  # Choose chromium, firefox, or webkit
+
+    async def _session(self) -> aiohttp.ClientSession:
+        """Lazily create a pooled aiohttp session reused across requests."""
+        if self._sess is None or self._sess.closed:
+            self._sess = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300, use_dns_cache=True),
+                timeout=aiohttp.ClientTimeout(total=30),
+                headers={"User-Agent": self.user_agent},
+            )
+        return self._sess
+
+    async def close(self) -> None:
+        """Close the HTTP session and shared browser, and stop the Playwright driver."""
+        if self._sess is not None:
+            await self._sess.close()
+            self._sess = None
+        if self._browser is not None:
+            await self._browser.close()
+            self._browser = None
+        if self._pw is not None:
+            await self._pw.stop()
+            self._pw = None
 
     async def fetch_with_aiohttp(self, url: str, use_proxy: bool = False) -> Dict[str, Any]:
         """Fetch a page using aiohttp."""
-        headers = {"User-Agent": self.user_agent}
         proxy = None
+        proxy_auth = None
         if use_proxy:
-            proxy = self._get_proxy()
+            proxy_config = self._get_proxy()
+            if proxy_config:
+                proxy = proxy_config['server']
+                proxy_auth = aiohttp.BasicAuth(proxy_config['username'], proxy_config['password'])
 
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.get(url, proxy=proxy, headers=headers) as response:
-                    html = await response.text()
-                    return {'url': url, 'content': html, 'status_code': response.status}
-            except Exception as e:
-                logger.error(f"Failed to fetch {url}: {e}")
-                return {'url': url, 'content': None, 'status_code': 500}
+        session = await self._session()
+        try:
+            async with session.get(url, proxy=proxy, proxy_auth=proxy_auth) as response:
+                html = await response.text()
+                return {'url': url, 'content': html, 'status_code': response.status}
+        except Exception as e:
+            logger.error(f"Failed to fetch {url}: {e}")
+            return {'url': url, 'content': None, 'status_code': 500}
 
     async def fetch_with_playwright(self, url: str, use_proxy: bool = False) -> Dict[str, Any]:
         """Fetch a page using Playwright for JavaScript rendering."""
         try:
-            async with async_playwright() as p:
-                browser_type = p.chromium  # Choose chromium, firefox, or webkit
-                launch_options = {}
-
-                if use_proxy:
-                    proxy = self._get_proxy()
-                    launch_options['proxy'] = {
-                        'server': proxy['server'],
-                        'username': proxy['username'],
-                        'password': proxy['password'],
-                    }
-
-                browser = await browser_type.launch(**launch_options)
-                context = await browser.new_context(user_agent=self.user_agent)
-                page = await context.new_page()
-                response = await page.goto(url)
-                content = await page.content()
-                status_code = response.status
-                await browser.close()
-                return {'url': url, 'content': content, 'status_code': status_code}
+            if self._browser is None:
+                await self.start()
+
+            context_options = {'user_agent': self.user_agent}
+            if use_proxy:
+                proxy = self._get_proxy()
+                if proxy:
+                    context_options['proxy'] = proxy
+
+            # Only a fresh context is created per request; the browser is shared and its
+            # concurrently open contexts are capped so parallel URLs do not overload it
+            async with self._context_slots:
+                context = await self._browser.new_context(**context_options)
+                try:
+                    await context.route("**/*", self._block_heavy_resources)
+                    page = await context.new_page()
+                    page.set_default_navigation_timeout(NAVIGATION_TIMEOUT_MS)
+                    response = await page.goto(url, wait_until="domcontentloaded")
+                    status_code = response.status
+                    content = await response.text()
+                    # Only wait for the full load and serialize the DOM when scripts may have changed it
+                    if not self._is_static_html_response(response.headers, content):
+                        await page.wait_for_load_state("load")
+                        content = await page.content()
+                finally:
+                    await context.close()
+            return {'url': url, 'content': content, 'status_code': status_code}
 
         except Exception as e:
             logger.error(f"Error fetching with Playwright: {e}")
             return {'url': url, 'content': None, 'status_code': 500}
 
+    @staticmethod
+    async def _block_heavy_resources(route) -> None:
+        """Abort requests for images, fonts, media and stylesheets; let everything else through."""
+        if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+        else:
+            await route.continue_()
+
     async def crawl_page(self, url: str, render_js: bool = True) -> Dict[str, Any]:
         """Crawl a page, optionally rendering JavaScript."""
         logger.info(f"Crawling {url} with {'JS rendering' if render_js else 'no JS rendering'}")
@@ -72,6 +154,34 @@ class ScrapingService:
             logger.error(f"Error during crawl: {e}")
             return {'url': url, 'content': None, 'status_code': 500}
 
+    @staticmethod
+    def _is_static_html_response(headers: Dict[str, str], body: str) -> bool:
+        """Check whether a navigation response is plain HTML that no external script will rewrite."""
+        content_type = headers.get("content-type", "")
+        return content_type.startswith("text/html") and not _EXTERNAL_SCRIPT.search(body)
+
+    def _is_usable_static_html(self, result: Dict[str, Any]) -> bool:
+        """Heuristically check whether a non-rendered fetch already holds the page content."""
+        html = result.get('content')
+        if result.get('status_code') != 200 or not html:
+            return False
+        if len(html) < MIN_STATIC_HTML_LENGTH:
+            return False
+        body = _BODY_OPEN.search(html)
+        if not body:
+            return False
+
+        # App shells render an (almost) empty body; <noscript> "enable JavaScript" notices are ignored so that
+        # ordinary pages carrying one stay on the static path. Stops as soon as enough text has been seen.
+        visible = 0
+        for token in _BODY_TOKEN.finditer(html, body.end()):
+            text = token.group(2)
+            if text:
+                visible += len(text.strip())
+                if visible >= MIN_STATIC_BODY_TEXT_LENGTH:
+                    return True
+        return False
+
     def _get_proxy(self) -> Optional[Dict[str, str]]:
         """Retrieve proxy configuration from environment variables."""
         host = os.getenv("PROXY_HOST")
@@ -88,4 +198,17 @@ class ScrapingService:
             link=result['url'],
             status_code=result['status_code'],
             html=result['content'],
-        )
\ No newline at end of file
+        )
+
+    async def fetch_url_adaptive(self, url: str) -> ScrapingServiceOutput:
+        """Fetches a URL over plain HTTP first, falling back to Playwright rendering only when needed."""
+        logger.info(f"Crawling {url} with no JS rendering")
+        result = await self.fetch_with_aiohttp(url)
+        if not self._is_usable_static_html(result):
+            logger.info(f"Static fetch of {url} looks incomplete; retrying with JS rendering")
+            result = await self.fetch_with_playwright(url)
+        return ScrapingServiceOutput(
+            link=result['url'],
+            status_code=result['status_code'],
+            html=result['content'],
+        )
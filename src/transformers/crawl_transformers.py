@@ -1,6 +1,8 @@
 import logging
-from typing import Dict
+from typing import Dict, Iterator
+import soupsieve as sv
 from bs4 import BeautifulSoup
+from lxml import html
 from src.utils.crawl_transformer_utils import CrawlTransformerUtils
 
 logger = logging.getLogger(__name__)
@@ -18,13 +20,16 @@ class CrawlTransformers:
             "#breadcrumbs", "#search-form", ".search", "#search", ".share", "#share",
             ".widget", "#widget", ".cookie", "#cookie"
         ]
+        # Compile all selectors into one matcher once so removal takes a single tree pass per page
+        self._exclude_matcher = sv.compile(", ".join(self.exclude_non_main_tags))
         self.transformer_utils = CrawlTransformerUtils()
 
-        # Register transformers dynamically for flexibility
+        # Register transformers dynamically for flexibility.
+        # All transformers share one parsed tree; metadata runs first because cleaning removes <head>.
         self.transformers = [
+            self._derive_metadata_from_html,
             self._derive_html_from_raw_html,
             self._derive_markdown_from_html,
-            self._derive_metadata_from_html,
             self._derive_node_tree,
         ]
 
@@ -36,12 +41,18 @@ class CrawlTransformers:
         :param document: Document dictionary containing rawHtml and additional fields.
         :return: Transformed document with additional fields like markdown, metadata, and node_tree.
         """
+        if "rawHtml" not in document or not document["rawHtml"]:
+            self.logger.error("rawHtml is undefined or empty. Transformation cannot proceed.")
+            return document
+
+        # Initialize html field with rawHtml once; _derive_html_from_raw_html replaces it with the cleaned HTML.
+        document["html"] = document["rawHtml"]
+
+        # Parse once with the C-accelerated lxml parser (via CrawlTransformerUtils.parse) and hand the same tree to every transformer.
+        # Cleaning mutates this tree in place, so it never needs re-parsing after html changes.
+        soup = self.transformer_utils.parse(document["rawHtml"])
         for transformer in self.transformers:
-            document["html"] = document["rawHtml"] # Initialize html field with rawHtml. will be updated later.
             try:
-                if "rawHtml" not in document or not document["rawHtml"]:
-                    raise ValueError("rawHtml is undefined or empty. Transformation cannot proceed.")
-                soup = BeautifulSoup(document["html"], "html.parser")
                 document = transformer(soup, meta, document)
             except Exception as e:
                 self.logger.error(f"Error in transformer {transformer.__name__}: {e}")
@@ -60,7 +71,8 @@ class CrawlTransformers:
             soup,
             exclude_tags=meta["options"].get("excludeTags", []),
             only_main_content=meta["options"].get("onlyMainContent", False),
-            extra_removals=self.exclude_non_main_tags
+            extra_removals=self.exclude_non_main_tags,
+            removal_matcher=self._exclude_matcher,
         )
         return document
 
@@ -95,10 +107,22 @@ class CrawlTransformers:
         """
         Converts the HTML structure into a JSONL node tree representation.
 
+        The cleaned HTML is walked as an lxml tree, which iterates in C and yields XPaths that match the
+        lxml selection done later in main content extraction. The node tree is a lazy generator: the HTML is only
+        parsed and walked once something iterates it, so pages whose main content is found without it skip both.
+        The parsed tree is then kept on the document as `html_tree` so that selection runs against it instead of
+        parsing the HTML again.
+
         :param soup: BeautifulSoup object of the HTML.
         :param meta: Metadata with processing options.
         :param document: Document dictionary to update.
         :return: Updated document dictionary with node tree.
         """
-        document["node_tree"] = self.transformer_utils.node_to_jsonl(soup)
+        document["node_tree"] = self._walk_node_tree(document)
         return document
+
+    def _walk_node_tree(self, document: Dict) -> Iterator[Dict]:
+        """Parse the cleaned HTML on first iteration, record it as `html_tree` and yield its node tree records."""
+        root = html.fromstring(document["html"])
+        document["html_tree"] = root
+        yield from self.transformer_utils.node_to_jsonl(root, self.transformer_utils.non_essential_tags)
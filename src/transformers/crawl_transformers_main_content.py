@@ -1,34 +1,57 @@
-import json
+import hashlib
 import logging
-import tiktoken
+import threading
+import orjson
 
-from langchain_openai import ChatOpenAI
-from typing import List, Dict, Any, Optional
-from bs4 import BeautifulSoup
+from collections import OrderedDict
+from functools import lru_cache
+from diskcache import Cache
+from typing import List, Dict, Any, Optional, Tuple
 from lxml import html
 
 from src.utils.crawl_transformer_utils import CrawlTransformerUtils
-from langchain.prompts import ChatPromptTemplate
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _get_encoding():
+    """Load the tiktoken encoding on first use; importing and loading it is expensive, so do it once per process."""
+    import tiktoken
+
+    return tiktoken.get_encoding("cl100k_base")
+
+
+# In-process LRU of (model, node tree) hash -> main content XPath, shared by all extractors
+_SELECTOR_CACHE: "OrderedDict[str, str]" = OrderedDict()
+_SELECTOR_CACHE_LOCK = threading.Lock()
+_SELECTOR_CACHE_SIZE = 1024
+
+
+# Node text is only a hint for the LLM, so it is cut to this many characters to save prompt tokens
+NODE_TEXT_MAX_CHARS = 80
+
+# The LLM only answers with a single node path, so cap its output length
+SELECTOR_MAX_OUTPUT_TOKENS = 128
+
+# Heuristic extractions with less text than this are treated as failures and fall back to the LLM
+MIN_HEURISTIC_TEXT_LENGTH = 500
+
+
 system_message = """
     # Extract Main Content Path from HTML Node Tree
 
-    You will be provided with a JSON representation of an HTML document's node tree. Your task is to identify and return the CSS selector path to the top-level node that contains the primary page content, excluding navigation, headers, footers, and other non-primary elements.
+    You will be provided with a compact listing of an HTML document's node tree. Each line holds a node path and a snippet of its text, separated by a tab. Your task is to identify and return the XPath of the top-level node that contains the primary page content, excluding navigation, headers, footers, and other non-primary elements.
 
     **Instructions:**
-    1. Analyze the provided JSON node tree.
+    1. Analyze the provided node tree listing.
     2. Identify the primary content node (e.g., `article`, `main`, or similar).
-    3. Construct a CSS selector path to that node using a specific and unambiguous format.
-    4. Return the CSS selector path string. Do not include any additional text.
+    3. Take that node's path exactly as written in the listing; it is an XPath such as `/html/body/div[2]/main`.
+    4. Return the XPath string. Do not include any additional text.
 
     **Example Input:**
-    [
-        {{path: /html/body/div/div/main/article, text: Some content here}},
-        {{path: /html/body/div/div/nav, text: Navigation}},
-    ]
+    /html/body/div/div/main/article\tSome content here
+    /html/body/div/div/nav\tNavigation
 
     **Expected Output:**
     ```
@@ -44,96 +67,221 @@ class CrawlTransformersMainContent:
 
         :param llm_config: Configuration parameters for the LLM model. Includes model, provider, api_key, and temperature.
         """
+        # Imported here so the langchain import cost is only paid when an extractor is created
+        from langchain_openai import ChatOpenAI
+        from langchain.prompts import ChatPromptTemplate
+
         self.llm_config = llm_config
         self.transformer_utils = CrawlTransformerUtils()
         self.max_tokens = 60000
-        self.llm = ChatOpenAI(model=llm_config.get("model", "gpt-4o"), temperature=llm_config.get("temperature", 0.5), api_key=llm_config.get("api_key", ""))
+        self.llm = ChatOpenAI(
+            model=llm_config.get("model", "gpt-4o-mini"),
+            temperature=llm_config.get("temperature", 0.0),
+            api_key=llm_config.get("api_key", ""),
+            max_tokens=SELECTOR_MAX_OUTPUT_TOKENS,
+        )
         self.prompt_template = ChatPromptTemplate.from_messages(("system", system_message, "human", "{nodes}"))
         self.llm_chain = self.prompt_template | self.llm
+        cache_dir = llm_config.get("cache_dir")
+        self.disk_cache = Cache(cache_dir) if cache_dir else None
 
-    def _trim_node_tree(self, node_tree: List[Dict], max_tokens: Optional[int] = None) -> str:
+    @staticmethod
+    def _format_node(node: Any) -> str:
         """
-        Trim the node tree JSON to fit within the maximum token limit.
+        Format one node tree record as a `path<TAB>text` line with whitespace collapsed and text truncated.
 
-        :param node_tree: The input node tree as a list of dictionaries.
-        :param max_tokens: Maximum number of tokens allowed for the JSON string.
-        :return: A trimmed JSON string representation of the node tree.
+        :param node: A node record dictionary, or the same record as a JSON string.
+        :return: The compact line for the node.
         """
-        encoding = tiktoken.get_encoding("cl100k_base")
-        while True:
-            json_string = json.dumps(node_tree)
-            token_count = len(encoding.encode(json_string))
-            max_tokens = max_tokens or self.max_tokens
-            if token_count <= max_tokens:
-                return json_string
-            if node_tree:
-                node_tree.pop()  # Remove one item from the end of the node tree
-            else:
-                raise ValueError("Node tree is empty. Cannot trim further.")
+        record = orjson.loads(node) if isinstance(node, (str, bytes)) else node
+        text = " ".join(record.get("text", "").split())[:NODE_TEXT_MAX_CHARS]
+        return f"{record['path']}\t{text}"
+
+    def _trim_node_tree(self, node_tree: List[Any], max_tokens: Optional[int] = None) -> str:
+        """
+        Trim the node tree listing to fit within the maximum token limit.
+
+        Each node is tokenized once and the largest prefix whose cumulative token count fits is kept,
+        so the cost is O(N) tokenization instead of re-encoding the whole tree on every removal.
+
+        :param node_tree: The input node tree as an iterable of JSONL strings or dictionaries.
+        :param max_tokens: Maximum number of tokens allowed for the listing.
+        :return: A trimmed `path<TAB>text` listing of the node tree, one node per line.
+        """
+        max_tokens = max_tokens or self.max_tokens
+        encoding = _get_encoding()
+
+        # The newline separators add a small fixed cost on top of each line's tokens
+        lines = [self._format_node(node) for node in node_tree]
+        per_node_tokens = [len(encoding.encode(line)) for line in lines]
+        separator_tokens = len(encoding.encode("\n"))
+
+        cutoff = 0
+        total = 0
+        for count in per_node_tokens:
+            total += count + (separator_tokens if cutoff else 0)
+            if total > max_tokens:
+                break
+            cutoff += 1
+
+        if lines and cutoff == 0:
+            raise ValueError("Node tree is empty. Cannot trim further.")
+        return "\n".join(lines[:cutoff])
 
 
     def extract_main_content(self, url: str, cleaned_data_obj: Dict[str, Any]) -> Dict[str, Any]:
         """
         Extract the main content path and HTML from the node tree.
 
-        :param cleaned_data_obj: Object containing `html`, `node_tree`, and `page_target`.
+        :param cleaned_data_obj: Object containing `html`, `node_tree`, and `page_target`, plus the `html_tree`
+            lxml root the node tree was built from (parsed from `html` when missing).
         :return: Updated cleaned data object with main content details added.
         """
         try:
             
             full_html = cleaned_data_obj["html"]
-            node_tree = cleaned_data_obj["node_tree"]
-            
-            # Trim the node tree to fit within token limits
-            trimmed_json_string = self._trim_node_tree(node_tree)
 
-            # Extract the main content selector
-            result = self.llm_chain.invoke({"nodes": trimmed_json_string})
-            
-            # Clean the result path
-            cleaned_result = self._clean_result_path(result.content.strip())
+            # Try the deterministic heuristic extractor first; it needs no LLM round-trip
+            heuristic = self._extract_with_heuristic(full_html)
+            if heuristic is not None:
+                cleaned_result = None
+                main_content_html, main_content_element = heuristic
+                main_content_nodes = [main_content_element]
+            else:
+                # Trim the node tree to fit within token limits; the pipeline's lazy node tree is only parsed and
+                # walked here, and records the lxml tree it came from as `html_tree`
+                trimmed_node_listing = self._trim_node_tree(cleaned_data_obj["node_tree"])
 
-            # Extract the HTML for the main content
-            main_content_html = self._get_main_content_html(full_html, cleaned_result)
+                # The node tree paths were taken from this lxml tree, so select from it rather than re-parsing
+                tree = cleaned_data_obj.get("html_tree")
+                if tree is None:
+                    tree = html.fromstring(full_html)
+
+                # Resolve the main content XPath (cached by model and node tree hash) and select its HTML
+                cleaned_result, main_content_html, main_content_nodes = self._resolve_main_content(
+                    trimmed_node_listing, tree
+                )
 
             # Update the cleaned data object
             cleaned_data_obj["mc_path"] = cleaned_result
             cleaned_data_obj["mc_html"] = main_content_html
             cleaned_data_obj["mc_markdown"] = self.transformer_utils.html_to_markdown(main_content_html)
-            cleaned_data_obj["mc_links"] = self.transformer_utils.extract_links(
-                BeautifulSoup(main_content_html, "html.parser"), url
-            )
+            cleaned_data_obj["mc_links"] = self.transformer_utils.extract_links_lxml(main_content_nodes, url)
 
             return cleaned_data_obj
         except Exception as e:
             logger.error(f"Error extracting main content: {e}")
             raise RuntimeError(f"Failed to extract main content: {e}")
 
-    def _get_main_content_html(self, full_html: str, main_content_selector: str) -> str:
+    def _extract_with_heuristic(self, full_html: str) -> Optional[Tuple[str, Any]]:
         """
-        Extract the HTML content for the main content node using the CSS selector.
+        Extract the main content HTML with trafilatura's readability-style heuristics.
 
         :param full_html: Full HTML content of the page.
-        :param main_content_selector: CSS selector path to the main content node.
-        :return: HTML content of the main content node.
+        :return: HTML of the main content and its parsed lxml element, or None if the heuristic found too little content.
+        """
+        # Imported here so the trafilatura import cost is only paid when extraction runs
+        import trafilatura
+
+        try:
+            main_html = trafilatura.extract(full_html, output_format="html", include_links=True)
+        except Exception as e:
+            logger.warning(f"Heuristic main content extraction failed: {e}")
+            return None
+
+        if not main_html:
+            return None
+        # Parsed once here for the length check and handed back so link extraction reuses it
+        main_element = html.fromstring(main_html)
+        if len(main_element.text_content().strip()) < MIN_HEURISTIC_TEXT_LENGTH:
+            return None
+        return main_html, main_element
+
+    def _resolve_main_content(self, node_listing: str, tree: Any) -> Tuple[str, str, List[Any]]:
+        """
+        Resolve the main content XPath for a node tree and select its HTML, skipping the LLM call on a cache hit.
+
+        Looks up the in-memory LRU first, then the disk cache, and only invokes the LLM on a miss. A fresh answer
+        is only cached once it has selected nodes, and a cached one that no longer selects anything is evicted,
+        so a bad answer is never replayed for later pages with the same template.
+
+        :param node_listing: Trimmed node tree listing sent to the LLM.
+        :param tree: lxml root of the page the node tree was built from.
+        :return: The XPath, the HTML of the main content, and the selected lxml nodes.
+        """
+        key = self._selector_cache_key(node_listing)
+        selector = self._get_cached_selector(key)
+        from_cache = selector is not None
+        if not from_cache:
+            result = self.llm_chain.invoke({"nodes": node_listing})
+            selector = self._clean_result_path(result.content.strip())
+
+        try:
+            main_content_html, main_content_nodes = self._get_main_content_html(tree, selector)
+        except ValueError:
+            if from_cache:
+                self._evict_selector(key)
+            raise
+
+        self._cache_selector(key, selector, persist=not from_cache)
+        return selector, main_content_html, main_content_nodes
+
+    def _selector_cache_key(self, node_listing: str) -> str:
+        """Key a node listing together with the model, so switching `LLM_MODEL` does not reuse another model's answers."""
+        model = self.llm_config.get("model", "gpt-4o-mini")
+        return hashlib.sha256(f"{model}\n{node_listing}".encode("utf-8")).hexdigest()
+
+    def _get_cached_selector(self, key: str) -> Optional[str]:
+        """Return the cached XPath for `key` from the in-memory LRU or the disk cache, or None on a miss."""
+        with _SELECTOR_CACHE_LOCK:
+            if key in _SELECTOR_CACHE:
+                _SELECTOR_CACHE.move_to_end(key)
+                return _SELECTOR_CACHE[key]
+        return self.disk_cache.get(key) if self.disk_cache is not None else None
+
+    def _cache_selector(self, key: str, selector: str, persist: bool) -> None:
+        """Store a working XPath in the in-memory LRU and, when `persist` is set, in the disk cache."""
+        if persist and self.disk_cache is not None:
+            self.disk_cache.set(key, selector)
+
+        with _SELECTOR_CACHE_LOCK:
+            _SELECTOR_CACHE[key] = selector
+            _SELECTOR_CACHE.move_to_end(key)
+            if len(_SELECTOR_CACHE) > _SELECTOR_CACHE_SIZE:
+                _SELECTOR_CACHE.popitem(last=False)
+
+    def _evict_selector(self, key: str) -> None:
+        """Drop an XPath that failed to select anything from both caches."""
+        with _SELECTOR_CACHE_LOCK:
+            _SELECTOR_CACHE.pop(key, None)
+        if self.disk_cache is not None:
+            self.disk_cache.delete(key)
+
+    def _get_main_content_html(self, tree: Any, main_content_selector: str) -> Tuple[str, List[Any]]:
+        """
+        Extract the HTML content for the main content node using its XPath.
+
+        :param tree: lxml root of the page.
+        :param main_content_selector: XPath to the main content node.
+        :return: HTML content of the main content node, and the selected lxml nodes.
         """
         try:
-            tree = html.fromstring(full_html)
             main_content_nodes = tree.xpath(main_content_selector)
         except Exception as e:
             raise ValueError(f"Failed to select main content nodes: {e}")
 
         if main_content_nodes:
             # Extract and concatenate HTML from selected nodes
-            return "".join(html.tostring(node, encoding="unicode") for node in main_content_nodes)
+            main_content_html = "".join(html.tostring(node, encoding="unicode") for node in main_content_nodes)
+            return main_content_html, main_content_nodes
         else:
             raise ValueError("Main content nodes not found in the HTML.")
 
     def _clean_result_path(self, result: str) -> str:
         """
-        Clean the CSS selector path extracted by the LLM.
+        Clean the XPath extracted by the LLM.
 
         :param result: Raw result string from the LLM.
-        :return: Cleaned CSS selector path.
+        :return: Cleaned XPath.
         """
         return result.replace("```", "").strip()
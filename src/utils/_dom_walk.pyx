@@ -0,0 +1,53 @@
+# cython: language_level=3
+"""
+Compiled version of the lxml DOM walk behind `CrawlTransformerUtils.node_to_jsonl`.
+
+Build in place with `cythonize -i src/utils/_dom_walk.pyx`; without the compiled extension the
+pure-Python implementation in `crawl_transformer_utils` is used. Keep the two in sync and rebuild after editing.
+"""
+
+
+def node_to_jsonl_c(object root, frozenset tags):
+    """
+    Converts an lxml element tree to JSONL records; same output as `CrawlTransformerUtils.node_to_jsonl`.
+
+    :param root: An lxml element to process.
+    :param tags: Tags whose subtrees are excluded from the JSONL.
+    :return: Generator of `{"path", "text"}` records.
+    """
+    cdef object tree = root.getroottree()
+    cdef dict paths = {}
+    cdef list stack = [(root, False)]
+    cdef list children
+    cdef object element
+    cdef object owner
+    cdef object tag
+    cdef object text
+    cdef object path
+    cdef bint is_tail
+    cdef Py_ssize_t i
+
+    while stack:
+        element, is_tail = stack.pop()
+        if is_tail:
+            owner = element.getparent()
+            text = element.tail
+        else:
+            tag = element.tag
+            if type(tag) is not str or tag in tags:
+                continue
+            owner = element
+            text = element.text
+            children = list(element)
+            for i in range(len(children) - 1, -1, -1):
+                stack.append((children[i], True))
+                stack.append((children[i], False))
+
+        if text:
+            text = text.strip()
+            if text:
+                path = paths.get(owner)
+                if path is None:
+                    path = tree.getpath(owner)
+                    paths[owner] = path
+                yield {"path": path, "text": text}